@@ -5,8 +5,10 @@ This Python script performs Fletcher's checksum algorithm for error detection in
 
 Key Functions:
 1. Fletcher16: Computes Fletcher's checksum for a given binary string. It compares the computed checksum with the provided checksum to validate the integrity of the data.
-2. validateInputString: Validates that the input string contains only binary characters ('0' and '1').
-3. main: Provides a user interface for selecting operations, accepting binary data, validating the input, and performing checksum operations.
+2. getFletcherSums: Computes the two running sums of the checksum over the data bits packed into an integer.
+3. getWeightMasks: Builds and caches, per data length, the bit masks used to add up the weights in the second sum.
+4. validateInputString: Validates that the input string contains only binary characters ('0' and '1').
+5. main: Provides a user interface for selecting operations, accepting binary data, validating the input, and performing checksum operations.
 
 Usage:
 - Run the script to display a menu with options to perform Fletcher's checksum or exit the program.
@@ -17,6 +19,8 @@ Author: Andrea Ximena Ramirez Recinos
 Date: Jul 2024
 """
 
+from functools import lru_cache
+
 def Fletcher16(input_string, size=16):
     """
     Compute Fletcher's checksum for a binary string.
@@ -28,21 +32,12 @@ def Fletcher16(input_string, size=16):
     Returns:
     - bool: True if the checksum matches the original checksum, False otherwise.
     """
-    sum1 = 0
-    sum2 = 0
-
     # Extract the original checksum from the end of the input string
     original_checksum = input_string[-size:]
     input_string = input_string[:-size]
-    module = 255
 
-    # Process each character of the input string
-    for char in input_string:
-        # Convert the character to an integer
-        value = int(char, 2)
-        # Update the checksum sums
-        sum1 = (sum1 + value) % module
-        sum2 = (sum2 + sum1) % module
+    # Compute both running sums over the data bits
+    sum1, sum2 = getFletcherSums(input_string)
 
     # Calculate the mask to ensure the result fits within the bit size
     mask = (1 << size) - 1
@@ -54,6 +49,49 @@ def Fletcher16(input_string, size=16):
     
     return original_checksum == checksum
 
+def getFletcherSums(input_string, module=255):
+    """
+    Compute the two running sums of Fletcher's checksum over a binary string.
+
+    Parameters:
+    - input_string (str): The binary data, without the checksum.
+    - module (int): The modulus applied to both sums. Default is 255.
+
+    Returns:
+    - tuple: The pair (sum1, sum2).
+    """
+    # Pack the bits into an integer, so the last bit (weight 1) is bit 0
+    ones = int(input_string or '0', 2)
+    # sum1 is the running total of the bits, so at the end it is the number of ones
+    sum1 = ones.bit_count() % module
+    # sum2 adds sum1 after every bit, so bit i is counted i + 1 times;
+    # add up those weights one binary digit at a time
+    sum2 = sum((ones & mask).bit_count() << k
+               for k, mask in enumerate(getWeightMasks(len(input_string)))) % module
+    return sum1, sum2
+
+@lru_cache(maxsize=128)
+def getWeightMasks(input_length):
+    """
+    Build, for each binary digit k, the mask of data bits whose weight has digit k set.
+
+    Parameters:
+    - input_length (int): The number of data bits.
+
+    Returns:
+    - tuple: One integer per digit k, with bit i set when i + 1 has bit k set.
+    """
+    # Twin of getParityMasks() in Hamming/hamming_receptor.py; keep the pattern in sync
+    masks = []
+
+    for k in range(input_length.bit_length()):
+        # Weights 0, 1, 2, ... alternate in runs of 2^k without/with digit k
+        run = 1 << k
+        pattern = ('0' * run + '1' * run) * (input_length // (2 * run) + 1)
+        # Drop weight 0 and reverse so that bit i maps to weight i + 1
+        masks.append(int(pattern[input_length:0:-1], 2))
+    return tuple(masks)
+
 def validateInputString(input_string):
     """
     Validate that the input string contains only binary characters ('0' or '1').
@@ -64,14 +102,12 @@ def validateInputString(input_string):
     Returns:
     - bool: True if the input string contains only '0' and '1', False otherwise.
     """
-    # Define a set containing binary characters '0' and '1'
-    binary_set = {'0', '1'}
-    
-    # Convert the input string to a set of characters
-    input_set = set(input_string)
+    # Reject empty strings and anything outside ASCII up front
+    if not input_string or not input_string.isascii():
+        return False
 
-    # Check if the input set matches the binary set or contains only '0' or '1'
-    return binary_set == input_set or input_set == {'0'} or input_set == {'1'}
+    # Delete every '0' and '1'; only a binary string leaves nothing behind
+    return not input_string.encode('ascii').translate(None, b'01')
 
 def main():
     """
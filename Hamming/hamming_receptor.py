@@ -3,7 +3,7 @@ Hamming Code Error Detection and Correction
 
 This program implements the Hamming code for error detection and correction on binary strings. It performs the following functions:
 
-1. **Hamming Code Generation**: Takes a binary string as input, calculates the number of parity bits required, and uses them to create a DataFrame for XOR operations to detect any errors in the data.
+1. **Hamming Code Generation**: Takes a binary string as input, calculates the number of parity bits required, and XORs the positions of the set bits to detect any errors in the data.
 2. **Error Detection**: Identifies and reports the position of any errors in the binary string based on the Hamming code. If no errors are detected, it confirms the message as error-free.
 3. **Input Validation**: Ensures that the input string contains only binary characters ('0' and '1').
 
@@ -16,8 +16,7 @@ Author: Andrea Ximena Ramirez Recinos
 Date: Jul 2024
 """
 
-import pandas as pd
-from functools import reduce
+from functools import lru_cache
 
 def hamming(input_string):
     """
@@ -30,54 +29,25 @@ def hamming(input_string):
     - str: The original input string if no errors are detected,
            or an error message indicating the position of the error.
     """
-    # Reverse the input string
-    input_string = input_string[::-1]
     # Get the length of the input string
     input_length = len(input_string)
-    # Calculate the number of parity bits needed
-    parity_bits = getParityBits(input_length)
-    # Generate a list of columns based on pow(2, i)
-    columns = [pow(2, i) for i in range(parity_bits)]
-    rows = []
-
-    for i in range(input_length):
-        if input_string[i] == '1':
-            rows.append(list("{0:0{1}b}".format(i + 1, parity_bits)))
-    
-    # Convert rows and columns into a DataFrame
-    df = pd.DataFrame(rows, columns=columns)
-
-    # Compute XOR for each column
-    def xorColumns(col_values):
-        """
-        Compute the XOR for a list of column values.
-
-        Parameters:
-        - col_values (list): List of column values (strings) to be XORed.
-
-        Returns:
-        - str: The result of XOR operation as a string.
-        """
-        return str(reduce(lambda x, y: int(x) ^ int(y), col_values))
-    
-    xor_results = [xorColumns(df[col]) for col in df.columns]
-    
-    # Concatenate the results into a single string
-    # and get the position of the error.
-    xor_int = int(''.join(xor_results), 2)
+    # Get the position of the error (0 if there is none)
+    xor_int = getSyndrome(input_string)
 
     if xor_int != 0:
-        # Convert the string to a list for mutability
-        correction = list(input_string)
         if xor_int >= input_length:
             return f'Error: The message may have multiple errors.'
-        # Fix the bit at the position determined by xor_int
-        correction[xor_int - 1] = '1' if correction[xor_int - 1] == '0' else '0'
-        input_string = ''.join(correction)
-        return f'Error: The message has errors at position {xor_int}. Message discarded.\nCorrect message: {input_string[::-1]}'
+        # Convert the string to bytes for mutability
+        correction = bytearray(input_string, 'ascii')
+        # Flip the bit at the position determined by xor_int (counted from the right);
+        # ord('0') ^ 1 == ord('1')
+        correction[input_length - xor_int] ^= 1
+        input_string = correction.decode('ascii')
+        return f'Error: The message has errors at position {xor_int}. Message discarded.\nCorrect message: {input_string}'
 
-    return f'The message is error-free: {input_string[::-1]}'
+    return f'The message is error-free: {input_string}'
 
+@lru_cache(maxsize=128)
 def getParityBits(input_length):
     """
     Calculate the number of parity bits required for a given input length.
@@ -94,6 +64,45 @@ def getParityBits(input_length):
         parity_bits += 1
     return parity_bits
 
+@lru_cache(maxsize=128)
+def getParityMasks(input_length):
+    """
+    Build, for each parity bit, the mask of positions it covers.
+
+    Parameters:
+    - input_length (int): The length of the input string.
+
+    Returns:
+    - tuple: One integer per parity bit k, with bit i set when the
+             1-based position i + 1 has bit k set.
+    """
+    # Twin of getWeightMasks() in Fletcher/fletcher_receptor.py; keep the pattern in sync
+    masks = []
+
+    for k in range(getParityBits(input_length)):
+        # Positions 0, 1, 2, ... alternate in runs of 2^k uncovered/covered
+        run = 1 << k
+        pattern = ('0' * run + '1' * run) * (input_length // (2 * run) + 1)
+        # Drop position 0 and reverse so that bit i maps to position i + 1
+        masks.append(int(pattern[input_length:0:-1], 2))
+    return tuple(masks)
+
+def getSyndrome(input_string):
+    """
+    Compute the Hamming syndrome of a binary string.
+
+    Parameters:
+    - input_string (str): The binary string, with position 1 as its last character.
+
+    Returns:
+    - int: The 1-based position of the erroneous bit, or 0 if there is none.
+    """
+    # Pack the string into an integer where bit i is position i + 1
+    ones = int(input_string, 2)
+    # Each syndrome bit is the parity of the set bits its parity bit covers
+    return sum(((ones & mask).bit_count() & 1) << k
+               for k, mask in enumerate(getParityMasks(len(input_string))))
+
 def validateInputString(input_string):
     """
     Validate that the input string contains only binary characters ('0' or '1').
@@ -104,14 +113,12 @@ def validateInputString(input_string):
     Returns:
     - bool: True if the input string contains only '0' and '1', False otherwise.
     """
-    # Define a set containing binary characters '0' and '1'
-    binary_set = {'0', '1'}
-    
-    # Convert the input string to a set of characters
-    input_set = set(input_string)
-
-    # Check if the input set matches the binary set or contains only '0' or '1'
-    return binary_set == input_set or input_set == {'0'} or input_set == {'1'}
+    # Reject empty strings and anything outside ASCII up front
+    if not input_string or not input_string.isascii():
+        return False
+
+    # Delete every '0' and '1'; only a binary string leaves nothing behind
+    return not input_string.encode('ascii').translate(None, b'01')
 
 def main():
     """